@@ -35,6 +35,7 @@ from .cbor_cose import (
     verify_signed_lce,
 )
 from .lri import LRI
+from .asgi import LRIMiddleware
 from .validator import validate_lce
 
 __all__ = [
@@ -50,6 +51,7 @@ __all__ = [
     "IntentType",
     "ConsentLevel",
     "LRI",
+    "LRIMiddleware",
     "validate_lce",
     "ltp",
     "lss",
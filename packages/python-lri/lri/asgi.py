@@ -0,0 +1,88 @@
+"""
+Pure ASGI middleware for LCE headers
+"""
+
+from typing import Optional
+
+import orjson
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .lri import LRI
+
+
+class LRIMiddleware:
+    """
+    ASGI middleware that parses the LCE header once per HTTP request
+
+    The header is read straight from ``scope["headers"]`` without building a
+    Starlette ``Request``, and the parsed LCE (or None) is stored in
+    ``scope["state"]["lce"]`` so handlers can read ``request.state.lce``.
+    Errors are answered directly with the same status codes and detail
+    payloads as ``LRI.parse_request``.
+
+    Example:
+        ```python
+        from fastapi import FastAPI, Request
+        from lri import LRIMiddleware
+
+        app = FastAPI()
+        app.add_middleware(LRIMiddleware, required=True)
+
+        @app.get("/api/data")
+        async def get_data(request: Request):
+            return {"intent": request.state.lce.intent.type}
+        ```
+    """
+
+    def __init__(
+        self, app: ASGIApp, lri: Optional[LRI] = None, required: bool = False
+    ):
+        """
+        Initialize LRI middleware
+
+        Args:
+            app: Downstream ASGI application
+            lri: LRI handler supplying header name and validation settings
+            required: Respond 428 if LCE is missing
+        """
+        self.app = app
+        self.lri = lri or LRI()
+        self.required = required
+        # ASGI servers deliver header names lowercased as raw bytes.
+        self._header_key = self.lri.header_name.lower().encode("ascii")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        raw = None
+        for key, value in scope["headers"]:
+            if key == self._header_key:
+                raw = value
+                break
+
+        try:
+            lce = self.lri.parse_header(raw, required=self.required)
+        except HTTPException as exc:
+            await _send_error(send, exc)
+            return
+
+        scope.setdefault("state", {})["lce"] = lce
+        await self.app(scope, receive, send)
+
+
+async def _send_error(send: Send, exc: HTTPException) -> None:
+    body = orjson.dumps({"detail": exc.detail})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": exc.status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -57,10 +57,10 @@ def _clean_value(value: Any) -> Any | None:
 
 def _normalize_lce(lce: LCE | Mapping[str, Any]) -> Mapping[str, Any]:
     if isinstance(lce, LCE):
-        raw = lce.model_dump(mode="python", exclude_none=True)
-    else:
-        raw = {str(k): v for k, v in lce.items() if v is not None}
+        # exclude_none already yields the cleaned shape for model instances.
+        return lce.model_dump(mode="python", exclude_none=True, exclude={"sig"})
 
+    raw = {str(k): v for k, v in lce.items() if v is not None}
     raw.pop("sig", None)
 
     normalized: MutableMapping[str, Any] = {}
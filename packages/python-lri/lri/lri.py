@@ -2,13 +2,87 @@
 LRI main class for FastAPI integration
 """
 
-import base64
-import json
-from typing import Awaitable, Callable, Optional
+import string
+from typing import Awaitable, Callable, Optional, Union
+
+import orjson
+import pybase64
 from fastapi import Request, HTTPException
-from .types import LCE
+from pydantic import ValidationError
+from .types import LCE, dump_lce_json, validate_lce_json, validate_lce_model
 from .validator import validate_lce
 
+# Cheap shape gate checked before any decoding work. Four characters is one
+# Base64 quantum; the upper bound is far above any realistic envelope.
+_MIN_HEADER_LEN = 4
+_MAX_HEADER_LEN = 64 * 1024
+_B64_ALPHABET = string.ascii_letters + string.digits + "+/"
+# Holds both characters and byte values: indexing a str header yields a str,
+# indexing a raw ASGI bytes header yields an int.
+_B64_FIRST = frozenset(_B64_ALPHABET) | frozenset(_B64_ALPHABET.encode("ascii"))
+
+# Error strings shared by every raise site; fully static details are built
+# once and reused. Treat them as read-only.
+_ERR_MISSING = "LCE header required"
+_ERR_MALFORMED = "Malformed LCE header"
+_ERR_INVALID = "Invalid LCE"
+_ERR_VALIDATION_FAILED = "LCE validation failed"
+_SHAPE_ERROR_DETAIL = {
+    "error": _ERR_MALFORMED,
+    "message": "LCE header is not a Base64 value",
+}
+
+
+def _is_json_error(exc: ValidationError) -> bool:
+    """Whether pydantic rejected the input as JSON rather than as an LCE."""
+    return exc.errors(include_url=False)[0]["type"] == "json_invalid"
+
+
+def _malformed(message: str) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail={
+            "error": _ERR_MALFORMED,
+            "message": message,
+        },
+    )
+
+
+def _validation_failed(exc: Exception) -> HTTPException:
+    return HTTPException(
+        status_code=422,
+        detail={
+            "error": _ERR_VALIDATION_FAILED,
+            "message": str(exc),
+        },
+    )
+
+
+def _passes_schema_checks(lce: LCE) -> bool:
+    """
+    Whether a strictly validated LCE also satisfies ``validate_lce``
+
+    Strict pydantic validation covers every ``validate_lce`` rule except the
+    ones the model relaxes: ``v`` has a default, and ``affect.pad`` and
+    ``qos.coherence`` accept an explicit null. Keep this in sync with
+    ``validate_lce``.
+    """
+    if "v" not in lce.model_fields_set:
+        return False
+    if (
+        lce.affect is not None
+        and lce.affect.pad is None
+        and "pad" in lce.affect.model_fields_set
+    ):
+        return False
+    if (
+        lce.qos is not None
+        and lce.qos.coherence is None
+        and "coherence" in lce.qos.model_fields_set
+    ):
+        return False
+    return True
+
 
 class LRI:
     """
@@ -39,6 +113,7 @@ class LRI:
         """
         self.header_name = header_name
         self.validate = validate
+        self._missing_detail = {"error": _ERR_MISSING, "header": header_name}
 
     async def parse_request(
         self, request: Request, required: bool = False
@@ -56,53 +131,85 @@ class LRI:
         Raises:
             HTTPException: 400 (malformed), 422 (invalid), 428 (missing)
         """
-        b64 = request.headers.get(self.header_name)
+        return self.parse_header(
+            request.headers.get(self.header_name), required=required
+        )
+
+    def parse_header(
+        self, b64: Optional[Union[str, bytes]], required: bool = False
+    ) -> Optional[LCE]:
+        """
+        Parse LCE from a raw header value
+
+        Shared by ``parse_request`` and ``LRIMiddleware`` so both surface the
+        same errors.
+
+        Args:
+            b64: Base64-encoded header value as str or raw ASGI bytes, or
+                None when absent
+            required: Raise 428 if LCE is missing
+
+        Returns:
+            Parsed LCE object or None
 
+        Raises:
+            HTTPException: 400 (malformed), 422 (invalid), 428 (missing)
+        """
         if not b64:
             if required:
-                raise HTTPException(
-                    status_code=428,
-                    detail={
-                        "error": "LCE header required",
-                        "header": self.header_name,
-                    },
-                )
+                raise HTTPException(status_code=428, detail=self._missing_detail)
             return None
 
+        if (
+            not _MIN_HEADER_LEN <= len(b64) <= _MAX_HEADER_LEN
+            or b64[0] not in _B64_FIRST
+        ):
+            raise HTTPException(status_code=400, detail=_SHAPE_ERROR_DETAIL)
+
         try:
-            json_str = base64.b64decode(b64).decode("utf-8")
-            data = json.loads(json_str)
+            decoded = pybase64.b64decode(b64, validate=True)
+            if not self.validate:
+                # No schema pass needed: let pydantic-core parse the JSON
+                # bytes directly instead of building an intermediate dict.
+                return validate_lce_json(decoded)
+        except ValidationError as e:
+            if _is_json_error(e):
+                raise _malformed(e.errors(include_url=False)[0]["msg"])
+            raise _validation_failed(e)
         except Exception as e:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "Malformed LCE header",
-                    "message": str(e),
-                },
-            )
+            raise _malformed(str(e))
 
-        if self.validate:
-            errors = validate_lce(data)
-            if errors:
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "error": "Invalid LCE",
-                        "details": errors,
-                    },
-                )
+        # Fast path: a strict model parse that also passes the schema checks
+        # needs no dict. Anything else takes the full path below so error
+        # reporting is unchanged.
+        try:
+            lce = validate_lce_json(decoded, strict=True)
+        except ValidationError:
+            pass
+        else:
+            if _passes_schema_checks(lce):
+                return lce
 
         try:
-            return LCE.model_validate(data)
+            data = orjson.loads(decoded)
         except Exception as e:
+            raise _malformed(str(e))
+
+        errors = validate_lce(data)
+        if errors:
             raise HTTPException(
                 status_code=422,
                 detail={
-                    "error": "LCE validation failed",
-                    "message": str(e),
+                    "error": _ERR_INVALID,
+                    "details": errors,
                 },
             )
 
+        try:
+            return validate_lce_model(data)
+        except Exception as e:
+            raise _validation_failed(e)
+
     def dependency(self, required: bool = False) -> Callable[[Request], Awaitable[Optional[LCE]]]:
         """Return a FastAPI dependency for parsing LCE headers.
 
@@ -133,5 +240,4 @@ class LRI:
         Returns:
             Base64-encoded JSON string
         """
-        json_str = lce.model_dump_json(exclude_none=True)
-        return base64.b64encode(json_str.encode("utf-8")).decode("utf-8")
+        return pybase64.b64encode_as_string(dump_lce_json(lce, exclude_none=True))
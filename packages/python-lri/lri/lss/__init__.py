@@ -6,7 +6,17 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 import math
-from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    cast,
+)
 
 from ..types import LCE
 
@@ -152,42 +162,137 @@ class RedisLike(Protocol):
         ...
 
 
+class IndexedRedisLike(RedisLike, Protocol):
+    """Additional commands needed when sessions are tracked in an index set."""
+
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        ...
+
+    def sadd(self, key: str, *members: str) -> int:
+        ...
+
+    def srem(self, key: str, *members: str) -> int:
+        ...
+
+    def smembers(self, key: str) -> Iterable[str]:
+        ...
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> Any:
+        ...
+
+
+# Removes index members whose session key is absent, checked atomically so an
+# id re-created by another worker since the caller's MGET is kept.
+# KEYS[1] is the index set, KEYS[2..] the session keys, ARGV the thread ids.
+_PRUNE_INDEX_SCRIPT = """
+local removed = 0
+for i = 2, #KEYS do
+  if redis.call("EXISTS", KEYS[i]) == 0 then
+    removed = removed + redis.call("SREM", KEYS[1], ARGV[i - 1])
+  end
+end
+return removed
+"""
+
+
 class RedisSessionStorage(SessionStorage):
-    """Redis-backed session storage."""
+    """Redis-backed session storage.
+
+    Sessions are listed with a keyspace SCAN over ``key_prefix`` by default,
+    which also sees sessions written by the Node adapter. Passing
+    ``index_key`` additionally tracks thread ids in a Redis set so listing
+    costs one SMEMBERS plus one MGET; the client must then implement
+    :class:`IndexedRedisLike`. Keys already under the prefix are backfilled
+    into the set on first listing, but sessions written later by storages
+    that do not maintain the set are not listed, so only enable the index
+    when every writer in the namespace uses it.
+    """
 
-    def __init__(self, client: RedisLike, *, key_prefix: str = "lss:session:") -> None:
+    def __init__(
+        self,
+        client: RedisLike,
+        *,
+        key_prefix: str = "lss:session:",
+        index_key: Optional[str] = None,
+    ) -> None:
         self._client = client
         self._key_prefix = key_prefix
+        self._index_key = index_key
+        self._backfilled = False
 
     def load(self, thread_id: str) -> Optional[LSSSession]:
         raw = self._client.get(self._key(thread_id))
         if raw is None:
             return None
-        if isinstance(raw, bytes):
-            raw = raw.decode("utf-8")
-        data = json.loads(raw)
-        return session_from_dict(data)
+        return _decode_session(raw)
 
     def save(self, session: LSSSession, ttl_ms: int) -> None:
         payload = json.dumps(session_to_dict(session), default=_json_default)
-        self._client.set(self._key(session.thread_id), payload, px=ttl_ms)
+        key = self._key(session.thread_id)
+        if self._index_key is None:
+            self._client.set(key, payload, px=ttl_ms)
+            return
+
+        client = self._indexed_client()
+        pipeline = getattr(client, "pipeline", None)
+        if pipeline is None:
+            client.set(key, payload, px=ttl_ms)
+            client.sadd(self._index_key, session.thread_id)
+            return
+
+        # Send SET and SADD in one round trip when the client supports it.
+        pipe = pipeline(transaction=False)
+        pipe.set(key, payload, px=ttl_ms)
+        pipe.sadd(self._index_key, session.thread_id)
+        pipe.execute()
 
     def delete(self, thread_id: str) -> bool:
+        if self._index_key is not None:
+            self._indexed_client().srem(self._index_key, thread_id)
         return self._client.delete(self._key(thread_id)) > 0
 
     def load_all(self) -> List[LSSSession]:
-        sessions: List[LSSSession] = []
-        for key in self._client.scan_iter(match=f"{self._key_prefix}*"):
-            raw = self._client.get(key)
+        if self._index_key is None:
+            sessions: List[LSSSession] = []
+            for key in self._scan_keys():
+                raw = self._client.get(key)
+                if raw is None:
+                    continue
+                sessions.append(_decode_session(raw))
+            return sessions
+
+        client = self._indexed_client()
+        if not self._backfilled:
+            self._backfill(client, self._index_key)
+
+        thread_ids = [_as_str(member) for member in client.smembers(self._index_key)]
+        if not thread_ids:
+            return []
+
+        sessions = []
+        expired: List[str] = []
+        raws = client.mget([self._key(thread_id) for thread_id in thread_ids])
+        for thread_id, raw in zip(thread_ids, raws):
             if raw is None:
+                expired.append(thread_id)
                 continue
-            if isinstance(raw, bytes):
-                raw = raw.decode("utf-8")
-            sessions.append(session_from_dict(json.loads(raw)))
+            sessions.append(_decode_session(raw))
+
+        if expired:
+            client.eval(
+                _PRUNE_INDEX_SCRIPT,
+                1 + len(expired),
+                self._index_key,
+                *(self._key(thread_id) for thread_id in expired),
+                *expired,
+            )
         return sessions
 
     def clear(self) -> None:
-        keys = list(self._client.scan_iter(match=f"{self._key_prefix}*"))
+        # Always scan so sessions missing from the index are removed too.
+        keys = list(self._scan_keys())
+        if self._index_key is not None:
+            keys.append(self._index_key)
         if keys:
             self._client.delete(*keys)
 
@@ -198,6 +303,30 @@ class RedisSessionStorage(SessionStorage):
     def _key(self, thread_id: str) -> str:
         return f"{self._key_prefix}{thread_id}"
 
+    def _scan_keys(self) -> Iterable[str]:
+        return self._client.scan_iter(match=f"{self._key_prefix}*")
+
+    def _indexed_client(self) -> IndexedRedisLike:
+        return cast(IndexedRedisLike, self._client)
+
+    def _backfill(self, client: IndexedRedisLike, index_key: str) -> None:
+        """Add sessions that predate the index, or were written without it."""
+        prefix_length = len(self._key_prefix)
+        thread_ids = [_as_str(key)[prefix_length:] for key in self._scan_keys()]
+        if thread_ids:
+            client.sadd(index_key, *thread_ids)
+        self._backfilled = True
+
+
+def _as_str(value: str | bytes) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _decode_session(raw: str | bytes) -> LSSSession:
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return session_from_dict(json.loads(raw))
+
 
 def session_to_dict(session: LSSSession) -> Dict[str, Any]:
     return {
@@ -205,7 +334,7 @@ def session_to_dict(session: LSSSession) -> Dict[str, Any]:
         "coherence": session.coherence,
         "messages": [
             {
-                "lce": message.lce.model_dump(),
+                "lce": message.lce.model_dump(exclude_none=True),
                 "payload": message.payload,
                 "timestamp": message.timestamp.isoformat(),
             }
@@ -509,11 +638,9 @@ class LSS:
         total_similarity = 0.0
         comparisons = 0
         for previous, current in zip(messages[:-1], messages[1:]):
-            prev_intent = previous.lce.intent.type
-            curr_intent = current.lce.intent.type
-            vec1 = INTENT_VECTORS.get(prev_intent, INTENT_VECTORS["tell"])
-            vec2 = INTENT_VECTORS.get(curr_intent, INTENT_VECTORS["tell"])
-            total_similarity += self._cosine_similarity(vec1, vec2)
+            total_similarity += _INTENT_SIMILARITY[
+                (previous.lce.intent.type, current.lce.intent.type)
+            ]
             comparisons += 1
 
         return total_similarity / comparisons if comparisons else 1.0
@@ -523,8 +650,13 @@ class LSS:
         if len(pads) < 2:
             return 1.0
 
-        variances = [self._variance([pad[i] for pad in pads]) for i in range(3)]
-        avg_variance = sum(variances) / 3
+        # Mean of the per-dimension population variances, one PAD axis at a time.
+        count = len(pads)
+        squared_deviations = 0.0
+        for values in zip(*pads):
+            mean = sum(values) / count
+            squared_deviations += sum((val - mean) ** 2 for val in values)
+        avg_variance = squared_deviations / (3 * count)
         return float(math.exp(-avg_variance * 5))
 
     def _semantic_alignment(self, messages: List[LSSMessage]) -> float:
@@ -594,12 +726,12 @@ class LSS:
             return 0.0
         return dot / (mag1 * mag2)
 
-    @staticmethod
-    def _variance(values: List[float]) -> float:
-        if not values:
-            return 0.0
-        mean = sum(values) / len(values)
-        return sum((val - mean) ** 2 for val in values) / len(values)
+# Intent vectors are fixed, so every pairwise cosine similarity is computed once.
+_INTENT_SIMILARITY: Dict[Tuple[str, str], float] = {
+    (first, second): LSS._cosine_similarity(vec1, vec2)
+    for first, vec1 in INTENT_VECTORS.items()
+    for second, vec2 in INTENT_VECTORS.items()
+}
 
 
 __all__ = [
@@ -610,6 +742,8 @@ __all__ = [
     "CoherenceResult",
     "DriftEvent",
     "InMemorySessionStorage",
+    "IndexedRedisLike",
+    "RedisLike",
     "RedisSessionStorage",
     "SessionStorage",
 ]
@@ -4,7 +4,7 @@ Based on LCE v0.1 schema
 """
 
 from typing import Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 IntentType = Literal[
     "ask",
@@ -115,3 +115,10 @@ class LCE(BaseModel):
     )
 
     model_config = {"extra": "forbid"}
+
+
+# Shared adapter so hot paths reuse one validator/serializer pair.
+LCE_ADAPTER: TypeAdapter[LCE] = TypeAdapter(LCE)
+validate_lce_model = LCE_ADAPTER.validate_python
+validate_lce_json = LCE_ADAPTER.validate_json
+dump_lce_json = LCE_ADAPTER.dump_json
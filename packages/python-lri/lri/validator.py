@@ -4,7 +4,28 @@ LCE validation against JSON Schema
 
 import json
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, get_args
+
+from .types import ConsentLevel, IntentType
+
+# Built once at import time instead of on every validate_lce() call. The
+# tuples keep declaration order for error messages; the frozensets give O(1)
+# membership checks.
+_VALID_INTENTS = get_args(IntentType)
+_VALID_CONSENT = get_args(ConsentLevel)
+_INTENT_TYPES = frozenset(_VALID_INTENTS)
+_CONSENT_LEVELS = frozenset(_VALID_CONSENT)
+_INVALID_INTENT_MESSAGE = (
+    f"Invalid intent type. Must be one of: {', '.join(_VALID_INTENTS)}"
+)
+_INVALID_CONSENT_MESSAGE = (
+    f"Invalid consent level. Must be one of: {', '.join(_VALID_CONSENT)}"
+)
+
+
+def _is_member(value: Any, allowed: frozenset[str]) -> bool:
+    # Non-strings (including unhashable lists/dicts) are never valid members.
+    return isinstance(value, str) and value in allowed
 
 
 def load_schema() -> dict[str, Any]:
@@ -43,26 +64,8 @@ def validate_lce(data: dict[str, Any]) -> Optional[list[dict[str, str]]]:
         errors.append(
             {"path": "/intent/type", "message": "Required field 'type' missing"}
         )
-    else:
-        valid_intents = [
-            "ask",
-            "tell",
-            "propose",
-            "confirm",
-            "notify",
-            "sync",
-            "plan",
-            "agree",
-            "disagree",
-            "reflect",
-        ]
-        if data["intent"]["type"] not in valid_intents:
-            errors.append(
-                {
-                    "path": "/intent/type",
-                    "message": f"Invalid intent type. Must be one of: {', '.join(valid_intents)}",
-                }
-            )
+    elif not _is_member(data["intent"]["type"], _INTENT_TYPES):
+        errors.append({"path": "/intent/type", "message": _INVALID_INTENT_MESSAGE})
 
     if "policy" not in data:
         errors.append({"path": "/policy", "message": "Required field 'policy' missing"})
@@ -72,15 +75,10 @@ def validate_lce(data: dict[str, Any]) -> Optional[list[dict[str, str]]]:
         errors.append(
             {"path": "/policy/consent", "message": "Required field 'consent' missing"}
         )
-    else:
-        valid_consent = ["private", "team", "public"]
-        if data["policy"]["consent"] not in valid_consent:
-            errors.append(
-                {
-                    "path": "/policy/consent",
-                    "message": f"Invalid consent level. Must be one of: {', '.join(valid_consent)}",
-                }
-            )
+    elif not _is_member(data["policy"]["consent"], _CONSENT_LEVELS):
+        errors.append(
+            {"path": "/policy/consent", "message": _INVALID_CONSENT_MESSAGE}
+        )
 
     # Validate affect.pad if present
     if "affect" in data and isinstance(data["affect"], dict):
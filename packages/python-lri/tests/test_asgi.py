@@ -0,0 +1,91 @@
+"""Tests for the pure ASGI middleware."""
+
+import base64
+import json
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from lri.asgi import LRIMiddleware
+from lri.lri import LRI
+from lri.types import LCE, Intent, Policy
+
+
+def _make_client(required: bool, lri: Optional[LRI] = None) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(LRIMiddleware, lri=lri, required=required)
+
+    @app.get("/intent")
+    async def intent_endpoint(request: Request) -> dict[str, Optional[str]]:
+        lce = request.state.lce
+        return {"intent": lce.intent.type if lce else None}
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def optional_client() -> TestClient:
+    return _make_client(required=False)
+
+
+@pytest.fixture(scope="module")
+def required_client() -> TestClient:
+    return _make_client(required=True)
+
+
+def _header(intent_type: str = "ask") -> str:
+    return LRI.create_header(
+        LCE(v=1, intent=Intent(type=intent_type), policy=Policy(consent="private"))
+    )
+
+
+def test_middleware_injects_parsed_lce(optional_client):
+    response = optional_client.get("/intent", headers={"LCE": _header("tell")})
+    assert response.status_code == 200
+    assert response.json() == {"intent": "tell"}
+
+
+def test_middleware_optional_header_yields_none(optional_client):
+    response = optional_client.get("/intent")
+    assert response.status_code == 200
+    assert response.json() == {"intent": None}
+
+
+def test_middleware_uses_custom_header_name():
+    client = _make_client(required=True, lri=LRI(header_name="X-Custom-LCE"))
+    response = client.get("/intent", headers={"X-Custom-LCE": _header()})
+    assert response.status_code == 200
+    assert response.json() == {"intent": "ask"}
+
+
+@pytest.mark.parametrize(
+    "headers,expected_status,expected_error",
+    [
+        ({}, 428, "LCE header required"),
+        ({"LCE": "!!!!"}, 400, "Malformed LCE header"),
+        (
+            {
+                "LCE": base64.b64encode(
+                    json.dumps(
+                        {
+                            "v": 1,
+                            "intent": {"type": "invalid"},
+                            "policy": {"consent": "private"},
+                        }
+                    ).encode("utf-8")
+                ).decode("utf-8")
+            },
+            422,
+            "Invalid LCE",
+        ),
+    ],
+)
+def test_middleware_rejects_bad_headers(
+    required_client, headers, expected_status, expected_error
+):
+    response = required_client.get("/intent", headers=headers)
+    assert response.status_code == expected_status
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["detail"]["error"] == expected_error
@@ -12,6 +12,7 @@ from lri import (
     base64url_encode,
     create_cose_sign1,
     deserialize_signed_lce,
+    encode_lce_cbor,
     sign_lce,
     verify_cose_sign1,
     verify_signed_lce,
@@ -85,3 +86,10 @@ def test_cose_helpers_are_consistent():
     cose_blob = cose_from_signed_lce(signed)
     assert base64url_encode(cose_blob) == expected
     assert base64url_decode(signed.sig or "") == cose_blob
+
+
+def test_encode_lce_cbor_matches_mapping_input():
+    lce, seed, _ = load_fixture()
+    signed = sign_lce(lce, seed)
+    as_mapping = signed.model_dump(mode="python")
+    assert encode_lce_cbor(signed) == encode_lce_cbor(as_mapping)
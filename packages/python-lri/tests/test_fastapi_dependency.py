@@ -18,9 +18,12 @@ def _decode_lce_header(header_value: str) -> dict:
     return json.loads(decoded)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def fastapi_dependency_app() -> tuple[LRI, TestClient]:
-    """Create a FastAPI app configured with the LRI dependency."""
+    """Create a FastAPI app configured with the LRI dependency.
+
+    The app holds no per-request state, so one instance serves the module.
+    """
 
     lri = LRI()
     app = FastAPI()
@@ -61,28 +64,6 @@ def fastapi_dependency_app() -> tuple[LRI, TestClient]:
     return lri, TestClient(app)
 
 
-def _build_header(
-    *,
-    intent_type: str = "ask",
-    consent: str = "private",
-    overrides: Optional[dict] = None,
-) -> str:
-    lce = {
-        "v": 1,
-        "intent": {"type": intent_type},
-        "policy": {"consent": consent},
-    }
-
-    for key, value in (overrides or {}).items():
-        if key in {"intent", "policy"} and isinstance(value, dict):
-            lce[key].update(value)
-        else:
-            lce[key] = value
-
-    header_bytes = json.dumps(lce).encode("utf-8")
-    return base64.b64encode(header_bytes).decode("utf-8")
-
-
 @pytest.mark.parametrize(
     "path,method,payload,header_factory,expected_status,expected_body",
     [
@@ -136,64 +117,6 @@ def test_required_dependency_rejects_missing_header(fastapi_dependency_app):
     }
 
 
-@pytest.mark.parametrize(
-    "overrides,expected_error,assertion",
-    [
-        (
-            {"intent": {"type": "invalid"}},
-            "Invalid LCE",
-            lambda detail: (
-                isinstance(detail.get("details"), list)
-                and detail["details"]
-                and detail["details"][0]["path"].startswith("/intent/type")
-                and "Invalid intent type" in detail["details"][0]["message"]
-            ),
-        ),
-        (
-            {"unexpected": "value"},
-            "LCE validation failed",
-            lambda detail: (
-                "unexpected" in detail.get("message", "")
-                and "Extra inputs are not permitted" in detail["message"]
-            ),
-        ),
-    ],
-)
-def test_dependency_returns_422_errors(
-    fastapi_dependency_app, overrides, expected_error, assertion
-):
-    lri, client = fastapi_dependency_app
-    header = _build_header(
-        intent_type="ask",
-        consent="private",
-        overrides=overrides,
-    )
-
-    response = client.post(
-        "/ingest",
-        json={"message": "ping"},
-        headers={lri.header_name: header},
-    )
-
-    assert response.status_code == 422
-    detail = response.json()["detail"]
-    assert detail["error"] == expected_error
-    assert assertion(detail), detail
-
-
-def test_dependency_returns_400_for_malformed_header(fastapi_dependency_app):
-    lri, client = fastapi_dependency_app
-    response = client.post(
-        "/ingest",
-        json={"message": "ping"},
-        headers={lri.header_name: "!!!!"},
-    )
-
-    assert response.status_code == 400
-    detail = response.json()["detail"]
-    assert detail["error"] == "Malformed LCE header"
-    assert detail["message"].startswith("Expecting value"), detail["message"]
-
 def test_dependency_round_trips_response_headers(fastapi_dependency_app):
     lri, client = fastapi_dependency_app
     request_header = lri.create_header(
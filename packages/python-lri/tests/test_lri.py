@@ -160,6 +160,24 @@ class TestLRIParseRequest:
         assert exc_info.value.status_code == 400
         assert "Malformed LCE header" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "header", ["YQ", "!eyJ2IjoxfQ==", "A" * (64 * 1024 + 4)]
+    )
+    async def test_parse_request_rejects_header_shape(self, header):
+        """parse_request should reject obviously malformed headers up front"""
+        request = MockRequest(headers={"LCE": header})
+        lri = LRI()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await lri.parse_request(request)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == {
+            "error": "Malformed LCE header",
+            "message": "LCE header is not a Base64 value",
+        }
+
     @pytest.mark.asyncio
     async def test_parse_request_invalid_json(self):
         """parse_request should raise 400 for invalid JSON"""
@@ -214,6 +232,63 @@ class TestLRIParseRequest:
         # Pydantic validation happens after schema validation
         assert exc_info.value.status_code == 422
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"v": None},
+            {"affect": {"pad": None}},
+            {"qos": {"coherence": None}},
+        ],
+    )
+    async def test_parse_request_schema_checks_beyond_model(self, overrides):
+        """parse_request should apply schema rules the model relaxes"""
+        lce = {
+            "v": 1,
+            "intent": {"type": "ask"},
+            "policy": {"consent": "private"},
+        }
+        lce.update(overrides)
+        if lce["v"] is None:
+            del lce["v"]
+        header = base64.b64encode(json.dumps(lce).encode("utf-8")).decode("utf-8")
+        request = MockRequest(headers={"LCE": header})
+        lri = LRI()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await lri.parse_request(request)
+
+        assert exc_info.value.status_code == 422
+        assert exc_info.value.detail["error"] == "Invalid LCE"
+
+    @pytest.mark.asyncio
+    async def test_parse_request_skip_validation_valid(self):
+        """parse_request should parse JSON directly when validation is disabled"""
+        header = LRI.create_header(
+            LCE(v=1, intent=Intent(type="plan"), policy=Policy(consent="team"))
+        )
+        request = MockRequest(headers={"LCE": header})
+        lri = LRI(validate=False)
+
+        result = await lri.parse_request(request)
+
+        assert result.intent.type == "plan"
+        assert result.policy.consent == "team"
+
+    @pytest.mark.asyncio
+    async def test_parse_request_skip_validation_invalid_json(self):
+        """parse_request should still raise 400 for bad JSON without validation"""
+        invalid_json = base64.b64encode(b"{ invalid json }").decode("utf-8")
+        request = MockRequest(headers={"LCE": invalid_json})
+        lri = LRI(validate=False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await lri.parse_request(request)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail["error"] == "Malformed LCE header"
+        assert "Invalid JSON" in exc_info.value.detail["message"]
+
     @pytest.mark.asyncio
     async def test_parse_request_custom_header_name(self):
         """parse_request should use custom header name"""
@@ -290,6 +365,92 @@ class TestLRIParseRequest:
         assert exc_info.value.status_code == 422
 
 
+class TestLRIParseHeader:
+    """Tests for parse_header with raw header values"""
+
+    def test_parse_header_accepts_bytes(self):
+        """parse_header should accept raw ASGI header bytes"""
+        header = LRI.create_header(
+            LCE(v=1, intent=Intent(type="ask"), policy=Policy(consent="private"))
+        )
+        result = LRI().parse_header(header.encode("ascii"))
+
+        assert result is not None
+        assert result.intent.type == "ask"
+
+    def test_parse_header_rejects_bytes_shape(self):
+        """parse_header should apply the shape gate to bytes too"""
+        with pytest.raises(HTTPException) as exc_info:
+            LRI().parse_header(b"!!!!")
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_parse_header_rejects_bom_prefixed_json(self, validate):
+        """A UTF-8 BOM before the JSON document is malformed in both modes"""
+        lce_json = b'{"v":1,"intent":{"type":"ask"},"policy":{"consent":"private"}}'
+        header = base64.b64encode(b"\xef\xbb\xbf" + lce_json).decode("utf-8")
+
+        with pytest.raises(HTTPException) as exc_info:
+            LRI(validate=validate).parse_header(header)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail["error"] == "Malformed LCE header"
+
+    @pytest.mark.parametrize(
+        "overrides,expected_error,assertion",
+        [
+            (
+                {"intent": {"type": "invalid"}},
+                "Invalid LCE",
+                lambda detail: (
+                    isinstance(detail.get("details"), list)
+                    and detail["details"]
+                    and detail["details"][0]["path"].startswith("/intent/type")
+                    and "Invalid intent type" in detail["details"][0]["message"]
+                ),
+            ),
+            (
+                {"unexpected": "value"},
+                "LCE validation failed",
+                lambda detail: (
+                    "unexpected" in detail.get("message", "")
+                    and "Extra inputs are not permitted" in detail["message"]
+                ),
+            ),
+        ],
+    )
+    def test_parse_header_returns_422_errors(
+        self, overrides, expected_error, assertion
+    ):
+        """parse_header should surface schema and model errors as 422"""
+        lce_data = {"v": 1, "intent": {"type": "ask"}, "policy": {"consent": "private"}}
+        for key, value in overrides.items():
+            if isinstance(value, dict):
+                lce_data[key].update(value)
+            else:
+                lce_data[key] = value
+        header = base64.b64encode(json.dumps(lce_data).encode("utf-8")).decode("utf-8")
+
+        with pytest.raises(HTTPException) as exc_info:
+            LRI().parse_header(header, required=True)
+
+        assert exc_info.value.status_code == 422
+        detail = exc_info.value.detail
+        assert detail["error"] == expected_error
+        assert assertion(detail), detail
+
+    def test_parse_header_returns_400_for_malformed_header(self):
+        """parse_header should reject non-Base64 values with a 400"""
+        with pytest.raises(HTTPException) as exc_info:
+            LRI().parse_header("!!!!", required=True)
+
+        assert exc_info.value.status_code == 400
+        detail = exc_info.value.detail
+        assert detail["error"] == "Malformed LCE header"
+        assert detail["message"] == "LCE header is not a Base64 value"
+
+
 class TestLRIRoundTrip:
     """Tests for round-trip encoding/decoding"""
 
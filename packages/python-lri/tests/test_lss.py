@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import fnmatch
+import heapq
+import json
+import math
 from datetime import datetime, timezone
+from typing import Iterable, Optional
 
 import pytest
 
@@ -8,6 +13,7 @@ from lri.lss import (
     CoherenceResult,
     DriftEvent,
     LSS,
+    RedisSessionStorage,
 )
 from lri.types import Affect, Intent, LCE, Meaning, Policy
 
@@ -21,6 +27,126 @@ def make_lce(intent: str, pad: tuple[float, float, float], topic: str) -> LCE:
     )
 
 
+class FakeRedis:
+    """In-memory stand-in for the Redis commands used by RedisSessionStorage."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.calls: list[str] = []
+        self._store: dict[str, tuple[str, Optional[float]]] = {}
+        self._sets: dict[str, set[str]] = {}
+        self._expiries: list[tuple[float, str]] = []
+        self._has_ttl = False
+
+    def advance(self, ms: int) -> None:
+        self.now += ms / 1000
+
+    def get(self, key: str) -> Optional[str]:
+        self.calls.append("get")
+        self._evict()
+        entry = self._store.get(key)
+        return entry[0] if entry else None
+
+    def set(self, key: str, value: str, *, px: Optional[int] = None) -> bool:
+        self.calls.append("set")
+        expires_at = self.now + px / 1000 if px else None
+        self._store[key] = (value, expires_at)
+        if expires_at is not None:
+            self._has_ttl = True
+            heapq.heappush(self._expiries, (expires_at, key))
+        return True
+
+    def delete(self, *keys: str) -> int:
+        self.calls.append("delete")
+        self._evict()
+        removed = 0
+        for key in keys:
+            if self._store.pop(key, None) is not None or self._sets.pop(key, None):
+                removed += 1
+        return removed
+
+    def mget(self, keys: list[str]) -> list[Optional[str]]:
+        self.calls.append("mget")
+        self._evict()
+        return [self._store[key][0] if key in self._store else None for key in keys]
+
+    def sadd(self, key: str, *members: str) -> int:
+        self.calls.append("sadd")
+        target = self._sets.setdefault(key, set())
+        added = len(set(members) - target)
+        target.update(members)
+        return added
+
+    def srem(self, key: str, *members: str) -> int:
+        self.calls.append("srem")
+        target = self._sets.get(key, set())
+        removed = len(target & set(members))
+        target.difference_update(members)
+        return removed
+
+    def smembers(self, key: str) -> Iterable[str]:
+        self.calls.append("smembers")
+        return set(self._sets.get(key, set()))
+
+    def scan_iter(self, match: str) -> Iterable[str]:
+        self.calls.append("scan")
+        self._evict()
+        return [key for key in list(self._store) if fnmatch.fnmatchcase(key, match)]
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> int:
+        # Emulates the index prune script: SREM ids whose key is absent.
+        self.calls.append("eval")
+        self._evict()
+        index_key, *keys = keys_and_args[:numkeys]
+        thread_ids = keys_and_args[numkeys:]
+        missing = [
+            thread_id
+            for key, thread_id in zip(keys, thread_ids)
+            if key not in self._store
+        ]
+        target = self._sets.get(index_key, set())
+        removed = len(target & set(missing))
+        target.difference_update(missing)
+        return removed
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:  # noqa: ARG002
+        return FakePipeline(self)
+
+    def _evict(self) -> None:
+        if not self._has_ttl:
+            return
+        # Pop only expired heap heads; entries superseded by a later SET
+        # carry a different expiry and are skipped.
+        while self._expiries and self._expiries[0][0] <= self.now:
+            expires_at, key = heapq.heappop(self._expiries)
+            entry = self._store.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._store[key]
+
+
+class FakePipeline:
+    """Queues commands and replays them against FakeRedis on execute."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs) -> FakePipeline:
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        self._redis.calls.append("execute")
+        commands, self._commands = self._commands, []
+        return [
+            getattr(self._redis, name)(*args, **kwargs)
+            for name, args, kwargs in commands
+        ]
+
+
 def test_store_and_metrics_roundtrip() -> None:
     store = LSS(coherence_window=5)
     store.store("thread-1", make_lce("ask", (0.2, 0.2, 0.2), "planning"))
@@ -103,3 +229,153 @@ def test_get_stats_returns_expected_totals() -> None:
     assert stats["session_count"] == 2
     assert stats["total_messages"] == 3
     assert 0 <= stats["average_coherence"] <= 1
+
+
+def test_get_stats_reflects_sessions() -> None:
+    redis = FakeRedis()
+    store = LSS(storage=RedisSessionStorage(redis, index_key="lss:sessions"))
+    store.store("redis-1", make_lce("ask", (0.1, 0.1, 0.1), "alpha"))
+    store.store("redis-2", make_lce("tell", (0.1, 0.1, 0.1), "beta"))
+    store.store("redis-2", make_lce("plan", (0.15, 0.1, 0.1), "beta"))
+    store.get_stats()  # first listing backfills the index with one SCAN
+
+    redis.calls.clear()
+    stats = store.get_stats()
+    assert stats["session_count"] == 2
+    assert stats["total_messages"] == 3
+    assert redis.calls == ["smembers", "mget"]
+
+    assert store.delete_session("redis-1") is True
+    assert redis.smembers("lss:sessions") == {"redis-2"}
+
+    store.clear()
+    assert store.get_stats()["session_count"] == 0
+    assert redis.smembers("lss:sessions") == set()
+
+
+def test_redis_storage_respects_ttl() -> None:
+    redis = FakeRedis()
+    store = LSS(
+        session_ttl=1_000,
+        storage=RedisSessionStorage(redis, index_key="lss:sessions"),
+    )
+    store.store("short-lived", make_lce("ask", (0.1, 0.1, 0.1), "alpha"))
+    assert store.get_session("short-lived") is not None
+
+    redis.advance(1_500)
+    assert store.get_session("short-lived") is None
+    assert store.get_stats()["session_count"] == 0
+    assert redis.smembers("lss:sessions") == set()
+
+
+def test_redis_storage_round_trips_payloads() -> None:
+    redis = FakeRedis()
+    store = LSS(storage=RedisSessionStorage(redis))
+    sent_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    store.store(
+        "payloads",
+        make_lce("tell", (0.1, 0.1, 0.1), "alpha"),
+        {"sent_at": sent_at, 1: "one"},
+    )
+
+    session = store.get_session("payloads")
+    assert session is not None
+    assert session.messages[0].payload == {
+        "sent_at": "2025-01-02T03:04:05+00:00",
+        "1": "one",
+    }
+
+
+def test_redis_storage_round_trips_big_ints_and_nan() -> None:
+    redis = FakeRedis()
+    store = LSS(storage=RedisSessionStorage(redis))
+    store.store(
+        "numbers",
+        make_lce("tell", (0.1, 0.1, 0.1), "alpha"),
+        {"big": 2**70, "nan": math.nan, "inf": math.inf},
+    )
+
+    session = store.get_session("numbers")
+    assert session is not None
+    payload = session.messages[0].payload
+    assert payload["big"] == 2**70
+    assert isinstance(payload["big"], int)
+    assert math.isnan(payload["nan"])
+    assert payload["inf"] == math.inf
+
+
+def test_redis_storage_pipelines_saves() -> None:
+    redis = FakeRedis()
+    store = LSS(storage=RedisSessionStorage(redis, index_key="lss:sessions"))
+    store.store("piped", make_lce("ask", (0.1, 0.1, 0.1), "alpha"))
+
+    assert redis.calls == ["get", "execute", "set", "sadd"]
+    assert redis.smembers("lss:sessions") == {"piped"}
+
+
+def test_redis_storage_omits_unset_lce_fields() -> None:
+    redis = FakeRedis()
+    store = LSS(storage=RedisSessionStorage(redis))
+    lce = make_lce("ask", (0.1, 0.1, 0.1), "alpha")
+    store.store("compact", lce)
+
+    raw = redis.get("lss:session:compact")
+    assert raw is not None
+    stored_lce = json.loads(raw)["messages"][0]["lce"]
+    assert set(stored_lce) == {"v", "intent", "affect", "meaning", "policy"}
+    assert "goal" not in stored_lce["intent"]
+
+    session = store.get_session("compact")
+    assert session is not None
+    assert session.messages[0].lce == lce
+
+
+def test_redis_storage_scans_without_index() -> None:
+    redis = FakeRedis()
+    writer = LSS(storage=RedisSessionStorage(redis))
+    writer.store("scan-1", make_lce("ask", (0.1, 0.1, 0.1), "alpha"))
+    # A session written by another adapter sharing the namespace.
+    redis.set("lss:session:other", redis.get("lss:session:scan-1"))
+
+    store = LSS(storage=RedisSessionStorage(redis))
+    assert store.get_stats()["session_count"] == 2
+    assert "smembers" not in redis.calls
+
+    store.clear()
+    assert redis.scan_iter("lss:session:*") == []
+
+
+def test_redis_storage_backfills_index_from_existing_keys() -> None:
+    redis = FakeRedis()
+    legacy = LSS(storage=RedisSessionStorage(redis))
+    legacy.store("legacy", make_lce("ask", (0.1, 0.1, 0.1), "alpha"))
+
+    store = LSS(storage=RedisSessionStorage(redis, index_key="lss:sessions"))
+    assert store.get_stats()["session_count"] == 1
+    assert redis.smembers("lss:sessions") == {"legacy"}
+
+
+def test_redis_storage_prune_keeps_recreated_sessions() -> None:
+    class RacingRedis(FakeRedis):
+        recreated: Optional[str] = None
+
+        def mget(self, keys: list[str]) -> list[Optional[str]]:
+            raws = super().mget(keys)
+            if self.recreated is not None:
+                # Another worker re-creates the expired session after the MGET.
+                self.set("lss:session:racy", self.recreated)
+            return raws
+
+    redis = RacingRedis()
+    store = LSS(
+        session_ttl=1_000,
+        storage=RedisSessionStorage(redis, index_key="lss:sessions"),
+    )
+    store.store("racy", make_lce("ask", (0.1, 0.1, 0.1), "alpha"))
+    redis.recreated = redis.get("lss:session:racy")
+
+    redis.advance(1_500)
+    assert store.get_stats()["session_count"] == 0
+    assert redis.smembers("lss:sessions") == {"racy"}
+    redis.recreated = None
+    assert store.get_stats()["session_count"] == 1
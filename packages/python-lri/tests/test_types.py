@@ -1,5 +1,7 @@
 """Tests for types module (Pydantic models)"""
 
+from typing import get_args
+
 import pytest
 from pydantic import ValidationError
 from lri.types import (
@@ -12,9 +14,18 @@ from lri.types import (
     Policy,
     QoS,
     Trace,
+    IntentType,
+    dump_lce_json,
+    validate_lce_model,
 )
 
 
+@pytest.fixture(scope="module")
+def base_lce() -> LCE:
+    """Minimal LCE shared by tests that only read or copy it."""
+    return LCE(v=1, intent=Intent(type="ask"), policy=Policy(consent="private"))
+
+
 class TestIntent:
     """Tests for Intent model"""
 
@@ -310,41 +321,34 @@ class TestLCE:
                 extra_field="not allowed",
             )
 
-    def test_lce_model_dump(self):
+    def test_lce_model_dump(self, base_lce):
         """LCE should serialize to dict correctly"""
-        lce = LCE(
-            v=1,
-            intent=Intent(type="ask"),
-            policy=Policy(consent="private"),
-        )
-        data = lce.model_dump()
+        data = base_lce.model_dump()
         assert data["v"] == 1
         assert data["intent"]["type"] == "ask"
         assert data["policy"]["consent"] == "private"
 
-    def test_lce_model_dump_excludes_none(self):
+    def test_lce_model_dump_excludes_none(self, base_lce):
         """LCE should exclude None values when serializing"""
-        lce = LCE(
-            v=1,
-            intent=Intent(type="ask"),
-            policy=Policy(consent="private"),
-        )
-        data = lce.model_dump(exclude_none=True)
+        data = base_lce.model_dump(exclude_none=True)
         assert "affect" not in data
         assert "meaning" not in data
         assert "trust" not in data
 
-    def test_lce_model_dump_json(self):
+    def test_lce_model_dump_json(self, base_lce):
         """LCE should serialize to JSON correctly"""
-        lce = LCE(
-            v=1,
-            intent=Intent(type="ask"),
-            policy=Policy(consent="private"),
-        )
-        json_str = lce.model_dump_json(exclude_none=True)
+        json_str = base_lce.model_dump_json(exclude_none=True)
         assert '"v":1' in json_str or '"v": 1' in json_str
         assert '"type":"ask"' in json_str or '"type": "ask"' in json_str
 
+    def test_lce_with_each_intent_type(self, base_lce):
+        """LCE should carry every intent type"""
+        for intent_type in get_args(IntentType):
+            lce = base_lce.model_copy(update={"intent": Intent(type=intent_type)})
+            assert lce.intent.type == intent_type
+            assert lce.policy is base_lce.policy
+        assert base_lce.intent.type == "ask"
+
     def test_lce_model_validate(self):
         """LCE should parse from dict correctly"""
         data = {
@@ -363,3 +367,16 @@ class TestLCE:
         lce = LCE.model_validate_json(json_str)
         assert lce.v == 1
         assert lce.intent.type == "ask"
+
+    def test_lce_adapter_round_trip(self):
+        """Shared adapter helpers should match the model methods"""
+        data = {
+            "v": 1,
+            "intent": {"type": "ask"},
+            "policy": {"consent": "private"},
+        }
+        lce = validate_lce_model(data)
+        assert isinstance(lce, LCE)
+        assert dump_lce_json(lce, exclude_none=True) == lce.model_dump_json(
+            exclude_none=True
+        ).encode("utf-8")
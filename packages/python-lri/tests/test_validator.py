@@ -115,6 +115,18 @@ class TestValidateLCE:
         assert errors is not None
         assert any(e["path"] == "/intent/type" for e in errors)
 
+    def test_non_string_intent_type(self):
+        """Non-string intent type should fail validation, not raise"""
+        lce = {
+            "v": 1,
+            "intent": {"type": ["ask"]},
+            "policy": {"consent": {"level": "private"}},
+        }
+        errors = validate_lce(lce)
+        assert errors is not None
+        assert any(e["path"] == "/intent/type" for e in errors)
+        assert any(e["path"] == "/policy/consent" for e in errors)
+
     def test_all_valid_intent_types(self):
         """All valid intent types should pass"""
         valid_intents = [